@@ -1,17 +1,118 @@
-from flask import Flask, render_template_string, request, jsonify
+import os
+
+def physical_cores():
+    """Physical cores this process may run on - SMT siblings count once"""
+    try:
+        cpus = os.sched_getaffinity(0)
+    except AttributeError:  # no affinity API outside Linux
+        return os.cpu_count() or 1
+    cores = set()
+    for cpu in cpus:
+        try:
+            with open(f'/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list') as f:
+                cores.add(f.read().strip())
+        except OSError:
+            cores.add(str(cpu))
+    return max(1, len(cores))
+
+def cpu_quota():
+    """CPUs granted by a cgroup v2 quota (containers/dynos), or None when unlimited"""
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()
+    except (OSError, ValueError):
+        return None
+    if quota == 'max':
+        return None
+    return max(1, -(-int(quota) // int(period)))
+
+# Inference runs in NUM_WORKERS processes that split the cores between them. Each
+# one holds a full model, so more than one is opt-in.
+CORES = min(physical_cores(), cpu_quota() or os.cpu_count() or 1)
+NUM_WORKERS = int(os.getenv('NUM_WORKERS', 1))
+THREADS_PER_WORKER = max(1, CORES // NUM_WORKERS)
+
+# OpenMP reads these when torch is imported, so they have to be set first.
+# PyPI torch ships GNU libgomp, so pinning uses the standard OMP_* variables.
+os.environ.setdefault('OMP_NUM_THREADS', str(THREADS_PER_WORKER))
+if NUM_WORKERS == 1:
+    # one thread per core; with several workers this would stack them all on the same cores
+    os.environ.setdefault('OMP_PLACES', 'cores')
+    os.environ.setdefault('OMP_PROC_BIND', 'close')
+
+from flask import Flask, Response, request
 import torch
-import torchvision.transforms as transforms
+from torchvision.transforms import v2
+from torchvision.io import decode_jpeg, ImageReadMode
 from torchvision import models
+from torchvision.models import quantization
 from PIL import Image
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+import gzip
+import hashlib
 import io
-import os
+import logging
+import multiprocessing
+import orjson
+import platform
+import queue
+import tempfile
+import threading
+import time
+import warnings
+import xxhash
 
 app = Flask(__name__)
+logger = logging.getLogger(__name__)
 
 # Configuration
 MIN_CONFIDENCE = 0.40
 MAX_CONFIDENCE = 1.00
 DEVICE = torch.device('cpu')
+# torchvision only ships fbgemm (x86) INT8 weights, so ARM hosts default to FP32 on XNNPACK
+IS_ARM = platform.machine().lower().startswith(('arm', 'aarch64'))
+QUANTIZE = os.getenv('QUANTIZE', '0' if IS_ARM else '1') == '1'  # INT8 (fbgemm) ResNet50 instead of FP32
+MODEL_BACKEND = os.getenv('MODEL_BACKEND', 'mobile' if IS_ARM else 'torchscript')  # torchscript | mobile | inductor | onnx | ipex | eager
+MAX_BATCH_SIZE = 8
+MAX_BATCH_DELAY_MS = 20
+RESIZE_SIZE = 256  # shorter side before the 224 center crop
+NORMALIZE_MEAN = [0.485, 0.456, 0.406]
+NORMALIZE_STD = [0.229, 0.224, 0.225]
+TOP_K = 5  # only 1 / MIN_CONFIDENCE classes can ever clear the threshold
+ONNX_QUANTIZE = os.getenv('ONNX_QUANTIZE', '0') == '1'  # dynamic INT8 for the onnx backend (ConvInteger is often slower than FP32)
+PREDICT_TIMEOUT_S = 60  # a request gives up on a stuck or still-starting worker after this
+CACHE_SIZE = 512  # predictions remembered per serving process, keyed by upload hash
+
+def cpu_supports_bf16():
+    """True on CPUs with native BF16 math (AVX512-BF16 / AMX)"""
+    try:
+        with open('/proc/cpuinfo') as f:
+            flags = f.read()
+    except OSError:
+        return False
+    return 'avx512_bf16' in flags or 'amx_bf16' in flags
+
+# The onnx and ipex backends start from the FP32 graph (onnx quantizes only with ONNX_QUANTIZE)
+TORCH_INT8 = QUANTIZE and MODEL_BACKEND not in ('onnx', 'ipex')
+
+# BF16 autocast only reaches the convs on backends that keep them as regular aten ops.
+# The INT8 model runs fbgemm kernels, and TorchScript's optimize_for_inference / XNNPACK
+# prepacking turn the convs into FP32 ops that aren't on autocast's lower-precision list.
+USE_BF16 = not TORCH_INT8 and MODEL_BACKEND in ('eager', 'inductor', 'ipex') and cpu_supports_bf16()
+
+# FP32 models can take raw [0, 1] pixels with Normalize folded into conv1 (the INT8 conv
+# can't be re-weighted). conv1's padding then moves into the input buffer. Opt-in until
+# check_fold_normalize.py has been run on the deploy host.
+FOLD_NORMALIZE = os.getenv('FOLD_NORMALIZE', '0') == '1' and not TORCH_INT8
+INPUT_PAD = 3 if FOLD_NORMALIZE else 0
+INPUT_SIZE = 224 + 2 * INPUT_PAD
+
+# Each worker runs one batch at a time, so give it its share of cores and skip inter-op parallelism
+torch.set_num_threads(THREADS_PER_WORKER)
+torch.set_num_interop_threads(1)
+torch.backends.mkldnn.enabled = True
 
 # ImageNet classes
 imagenet_classes = {
@@ -28,80 +129,379 @@ imagenet_classes = {
     "504": "coffee mug", "620": "laptop", "850": "television", "858": "toaster",
     "927": "ice cream", "948": "strawberry", "949": "orange", "950": "lemon", "962": "pizza"
 }
+# Same table keyed by the integer ids topk returns, so lookups don't build a str per prediction
+imagenet_classes_by_id = {int(k): v for k, v in imagenet_classes.items()}
+
+class OnnxModel:
+    """Exports the model to ONNX and runs it on ONNX Runtime's CPU provider"""
+    
+    def __init__(self, model):
+        import onnxruntime as ort
+        
+        opts = ort.SessionOptions()
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        opts.intra_op_num_threads = torch.get_num_threads()
+        opts.inter_op_num_threads = 1
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'rn50.onnx')
+            torch.onnx.export(
+                model, torch.randn(1, 3, INPUT_SIZE, INPUT_SIZE), path,
+                opset_version=17,
+                input_names=['input'], output_names=['logits'],
+                dynamic_axes={'input': {0: 'batch'}, 'logits': {0: 'batch'}},
+            )
+            if ONNX_QUANTIZE:
+                from onnxruntime.quantization import quantize_dynamic, QuantType
+                int8_path = os.path.join(tmp, 'rn50.int8.onnx')
+                quantize_dynamic(path, int8_path, weight_type=QuantType.QUInt8)
+                path = int8_path
+            self.session = ort.InferenceSession(path, sess_options=opts, providers=['CPUExecutionProvider'])
+    
+    def __call__(self, batch):
+        outputs = self.session.run(None, {'input': batch.contiguous().numpy()})
+        return torch.from_numpy(outputs[0])
 
-print("Loading ResNet50 model...")
-try:
-    model = models.resnet50(weights=models.ResNet50_Weights.DEFAULT)
-    model = model.to(DEVICE)
-    model.eval()
-    print("✅ Model loaded successfully!")
-except Exception as e:
-    print(f"Error loading model: {e}")
-    model = models.resnet50(pretrained=True)
-    model = model.to(DEVICE)
-    model.eval()
-
-preprocess = transforms.Compose([
-    transforms.Resize(256),
-    transforms.CenterCrop(224),
-    transforms.ToTensor(),
-    transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225]),
+def optimize_model(model):
+    """Wrap the eval-mode model in the configured MODEL_BACKEND"""
+    if MODEL_BACKEND == 'torchscript':
+        # freeze inlines weights as constants; optimize_for_inference then folds BatchNorm into Conv
+        frozen = torch.jit.freeze(torch.jit.script(model))
+        return torch.jit.optimize_for_inference(frozen)
+    if MODEL_BACKEND == 'mobile':
+        # freezes, fuses and prepacks conv weights for XNNPACK's NEON/AVX NHWC kernels
+        from torch.utils.mobile_optimizer import optimize_for_mobile
+        return optimize_for_mobile(torch.jit.script(model))
+    if MODEL_BACKEND == 'onnx':
+        return OnnxModel(model)
+    if MODEL_BACKEND == 'ipex':
+        # fuses conv-bn-relu, prepacks weights into blocked layouts and targets AMX tiles for BF16
+        import intel_extension_for_pytorch as ipex
+        dtype = torch.bfloat16 if USE_BF16 else torch.float32
+        return ipex.optimize(model, dtype=dtype, level='O1', weights_prepack=True)
+    if MODEL_BACKEND == 'inductor':
+        # pin dynamic=False so each batch size (at most MAX_BATCH_SIZE of them) gets its own static graph
+        return torch.compile(model, mode='reduce-overhead', dynamic=False)
+    return model
+
+def fold_normalize(model):
+    """Fold (x - mean) / std into conv1 so the model takes raw [0, 1] pixels.
+    
+    conv1's zero padding is dropped: padding the raw input with the mean is the same
+    as zero-padding the normalized one, and the input buffer provides that border.
+    """
+    conv = model.conv1
+    mean = torch.tensor(NORMALIZE_MEAN, device=DEVICE).view(1, 3, 1, 1)
+    std = torch.tensor(NORMALIZE_STD, device=DEVICE).view(1, 3, 1, 1)
+    with torch.no_grad():
+        weight = conv.weight / std
+        bias = -(weight * mean).sum(dim=(1, 2, 3))
+        if conv.bias is not None:
+            bias += conv.bias
+        conv.weight.copy_(weight)
+    conv.bias = torch.nn.Parameter(bias)
+    conv.padding = (0, 0)
+    return model
+
+def load_model():
+    """Load ResNet50 and wrap it in the configured MODEL_BACKEND"""
+    print("Loading ResNet50 model...")
+    try:
+        if TORCH_INT8:
+            torch.backends.quantized.engine = 'fbgemm'
+            model = quantization.resnet50(weights=quantization.ResNet50_QuantizedWeights.DEFAULT, quantize=True)
+        else:
+            model = models.resnet50(weights=models.ResNet50_Weights.DEFAULT)
+        model = model.to(DEVICE)
+        model.eval()
+        print("✅ Model loaded successfully!")
+    except Exception as e:
+        logger.warning("Error loading model, falling back to FP32 ResNet50: %s", e, exc_info=True)
+        model = models.resnet50(pretrained=True)
+        model = model.to(DEVICE)
+        model.eval()
+    
+    if FOLD_NORMALIZE:
+        model = fold_normalize(model)
+    
+    # NHWC layout matches oneDNN's conv kernels and skips the internal reorder
+    model = model.to(memory_format=torch.channels_last)
+    
+    # Optimize once at load time and run a warmup pass so the first request doesn't pay for it
+    try:
+        optimized = optimize_model(model)
+        with torch.inference_mode(), torch.autocast('cpu', dtype=torch.bfloat16, enabled=USE_BF16):
+            # One pass per batch size: inductor builds a static graph for each and
+            # TorchScript's profiling executor specializes on the shapes it has seen
+            for batch_size in range(1, MAX_BATCH_SIZE + 1):
+                optimized(torch.zeros(batch_size, 3, INPUT_SIZE, INPUT_SIZE, device=DEVICE).contiguous(memory_format=torch.channels_last))
+        model = optimized
+        print(f"✅ Model optimized ({MODEL_BACKEND})!")
+    except Exception as e:
+        # Loud on purpose: a backend that silently drops to eager only shows up as slowness
+        logger.warning("MODEL_BACKEND=%s could not be built, running eager instead: %s", MODEL_BACKEND, e, exc_info=True)
+    
+    return model
+
+# Tensor-backend pipeline: resize/crop run on uint8 and convert+normalize happen once at the end
+preprocess = v2.Compose([
+    v2.PILToTensor(),
+    v2.Resize(RESIZE_SIZE, antialias=True),
+    v2.CenterCrop(224),
+    v2.ToDtype(torch.float32, scale=True),
+    v2.Identity() if FOLD_NORMALIZE else v2.Normalize(mean=NORMALIZE_MEAN, std=NORMALIZE_STD),
 ])
 
-def predict_image(image_bytes):
-    """Predict objects - returns 40% to 100% confidence"""
+# decode_jpeg only reads the upload buffer, so viewing the immutable bytes is safe
+warnings.filterwarnings('ignore', message='The given buffer is not writable')
+
+def decode_image(image_bytes):
+    """Decode an upload to RGB at no more resolution than preprocess needs"""
+    img = Image.open(io.BytesIO(image_bytes))  # lazy - only the header is parsed here
+    if img.format == 'JPEG' and min(img.size) < 2 * RESIZE_SIZE:
+        # Too small for a reduced-scale decode: go straight to a uint8 tensor via libjpeg-turbo
+        try:
+            return decode_jpeg(torch.frombuffer(image_bytes, dtype=torch.uint8), mode=ImageReadMode.RGB)
+        except RuntimeError:
+            pass  # let PIL deal with JPEG variants libjpeg-turbo rejects
+    # For large JPEGs libjpeg does the IDCT at 1/2, 1/4 or 1/8 scale while both
+    # sides stay >= RESIZE_SIZE, so the full-size bitmap is never materialized
+    img.draft('RGB', (RESIZE_SIZE, RESIZE_SIZE))
+    return img.convert('RGB')
+
+def postprocess(top_probs, top_ids):
+    """Turn one image's top-k (as Python lists) into the 40%-100% prediction list"""
+    predictions = []
+    for conf, class_id in zip(top_probs, top_ids):
+        if conf < MIN_CONFIDENCE:
+            break
+        if conf > MAX_CONFIDENCE:
+            continue
+        class_name = imagenet_classes_by_id.get(class_id, f"Class {class_id}")
+        conf_percent = round(conf * 100, 1)
+        predictions.append({
+            'class': class_name,
+            'confidence': conf_percent
+        })
+    
+    return predictions
+
+def new_batch_buffer(batch_size):
+    """NHWC model input whose INPUT_PAD border is filled with the mean (zero once normalized).
+    
+    Images go into the 224x224 center; the border is written once and never overwritten.
+    """
+    mean = torch.tensor(NORMALIZE_MEAN, device=DEVICE).view(1, 3, 1, 1)
+    return mean.expand(batch_size, 3, INPUT_SIZE, INPUT_SIZE).contiguous(memory_format=torch.channels_last)
+
+# Set in each worker process by init_worker
+model = None
+batch_buffer = None
+startup_barrier = None
+
+def init_worker(barrier):
+    """Process pool initializer - every worker holds its own model and input buffer"""
+    global model, batch_buffer, startup_barrier
+    startup_barrier = barrier
+    model = load_model()
+    # Reused for every batch so images are copied straight into NHWC slots
+    # instead of allocating a fresh stacked tensor
+    batch_buffer = new_batch_buffer(MAX_BATCH_SIZE)
+
+def wait_for_workers():
+    """Startup task - parks this worker until every worker has loaded its model"""
+    startup_barrier.wait()
+
+def infer_batch(images):
+    """Runs in a worker process: decode, preprocess and classify a batch of uploads.
+    
+    Returns one entry per image - its prediction list, or the exception that image raised.
+    """
+    results = [None] * len(images)
+    slots = []
+    for i, image_bytes in enumerate(images):
+        try:
+            img = decode_image(image_bytes)
+            batch_buffer[len(slots), :, INPUT_PAD:INPUT_PAD + 224, INPUT_PAD:INPUT_PAD + 224].copy_(preprocess(img))
+            slots.append(i)
+        except Exception as e:
+            results[i] = e
+    
+    if slots:
+        batch = batch_buffer[:len(slots)]
+        with torch.inference_mode(), torch.autocast('cpu', dtype=torch.bfloat16, enabled=USE_BF16):
+            outputs = model(batch)
+        probs = torch.nn.functional.softmax(outputs.float(), dim=1)
+        # one topk and one tensor->list conversion for the whole batch
+        top_probs, top_ids = torch.topk(probs, TOP_K, dim=1)
+        for i, row_probs, row_ids in zip(slots, top_probs.tolist(), top_ids.tolist()):
+            results[i] = postprocess(row_probs, row_ids)
+    
+    return results
+
+# Micro-batching: concurrent requests are grouped and each group is one forward pass in a worker
+batch_queue = queue.Queue()
+# At most one batch in flight per worker, so requests keep piling into the next batch meanwhile
+worker_slots = threading.BoundedSemaphore(NUM_WORKERS)
+executor = None
+
+pool_broken = threading.Event()
+
+def report_broken_pool(e):
+    """Flag a broken pool from a Future callback; pool_watchdog does the teardown.
+    
+    Exiting right here would run before the pool terminates its surviving workers,
+    orphaning processes that each hold a loaded model.
+    """
+    print(f"Inference pool is broken, restarting: {e}")
+    pool_broken.set()
+
+def pool_watchdog():
+    """A dead worker (OOM, decoder crash, failed init_worker) breaks the whole pool for good.
+    
+    Kill every worker process, then exit so gunicorn respawns this worker with a fresh pool
+    instead of erroring every request.
+    """
+    pool_broken.wait()
+    executor.shutdown(wait=False, cancel_futures=True)
+    workers = multiprocessing.active_children()
+    for worker in workers:
+        worker.terminate()
+    for worker in workers:
+        worker.join(timeout=5)
+        if worker.is_alive():
+            worker.kill()
+            worker.join()
+    os._exit(1)
+
+def check_startup(done):
+    """Fail fast if a worker died while loading its model"""
+    if isinstance(done.exception(), BrokenProcessPool):
+        report_broken_pool(done.exception())
+
+def resolve_batch(futures, done):
+    """Hand each request its own result once a worker finishes the batch"""
+    worker_slots.release()
     try:
-        img = Image.open(io.BytesIO(image_bytes)).convert('RGB')
-        img_tensor = preprocess(img).unsqueeze(0).to(DEVICE)
-        
-        with torch.no_grad():
-            outputs = model(img_tensor)
-            probs = torch.nn.functional.softmax(outputs[0], dim=0)
-        
-        top_probs, top_ids = torch.topk(probs, 50)
-        
-        predictions = []
-        for i in range(top_probs.size(0)):
-            conf = top_probs[i].item()
-            if MIN_CONFIDENCE <= conf <= MAX_CONFIDENCE:
-                class_id = str(top_ids[i].item())
-                class_name = imagenet_classes.get(class_id, f"Class {class_id}")
-                conf_percent = round(conf * 100, 1)
-                predictions.append({
-                    'class': class_name,
-                    'confidence': conf_percent
-                })
-            elif conf < MIN_CONFIDENCE:
+        results = done.result()
+    except Exception as e:
+        if isinstance(e, BrokenProcessPool):
+            report_broken_pool(e)
+        results = [e] * len(futures)
+    for future, result in zip(futures, results):
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+def batch_worker():
+    """Drain up to MAX_BATCH_SIZE queued uploads (or wait MAX_BATCH_DELAY_MS) and send them to a worker as one batch"""
+    while True:
+        worker_slots.acquire()
+        items = [batch_queue.get()]
+        deadline = time.monotonic() + MAX_BATCH_DELAY_MS / 1000
+        while len(items) < MAX_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                items.append(batch_queue.get(timeout=timeout))
+            except queue.Empty:
                 break
         
+        images, futures = zip(*items)
+        try:
+            done = executor.submit(infer_batch, list(images))
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                report_broken_pool(e)
+            worker_slots.release()
+            for future in futures:
+                future.set_exception(e)
+            continue
+        done.add_done_callback(lambda done, futures=futures: resolve_batch(futures, done))
+
+# Only the serving process starts the pool; spawned workers re-import this module.
+# Under gunicorn this runs inside the worker after fork (don't use --preload).
+if multiprocessing.parent_process() is None:
+    mp_context = multiprocessing.get_context('spawn')
+    executor = ProcessPoolExecutor(
+        max_workers=NUM_WORKERS,
+        mp_context=mp_context,
+        initializer=init_worker,
+        initargs=(mp_context.Barrier(NUM_WORKERS),),
+    )
+    # The pool spawns at most one worker per submit, and only while none is idle.
+    # One startup task per worker, each parked on the barrier until all have
+    # loaded, makes every worker start (and load its model) before real traffic.
+    for _ in range(NUM_WORKERS):
+        executor.submit(wait_for_workers).add_done_callback(check_startup)
+    threading.Thread(target=batch_worker, daemon=True).start()
+    threading.Thread(target=pool_watchdog, daemon=True).start()
+
+# LRU of upload digest -> predictions. Keyed by the hash alone (not functools.lru_cache
+# on the bytes) so re-uploads hit without keeping up to CACHE_SIZE images in memory.
+prediction_cache = OrderedDict()
+prediction_cache_lock = threading.Lock()
+
+def predict_image(image_bytes):
+    """Predict objects - returns 40% to 100% confidence"""
+    try:
+        digest = xxhash.xxh3_128_digest(image_bytes)
+        with prediction_cache_lock:
+            if digest in prediction_cache:
+                prediction_cache.move_to_end(digest)
+                return prediction_cache[digest]
+        
+        future = Future()
+        batch_queue.put((image_bytes, future))
+        try:
+            predictions = future.result(timeout=PREDICT_TIMEOUT_S)
+        except FutureTimeoutError:
+            raise Exception(f"prediction timed out after {PREDICT_TIMEOUT_S}s")
+        
+        with prediction_cache_lock:
+            prediction_cache[digest] = predictions
+            if len(prediction_cache) > CACHE_SIZE:
+                prediction_cache.popitem(last=False)
         return predictions
     except Exception as e:
         raise Exception(f"Error: {str(e)}")
 
+def ojson(obj):
+    """jsonify replacement that serializes with orjson"""
+    return Response(orjson.dumps(obj), mimetype='application/json')
+
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    """Serve the prebuilt page (gzipped when the client accepts it) with ETag revalidation"""
+    if request.accept_encodings['gzip'] > 0:  # quality lookup, so 'gzip;q=0' is honoured
+        response = Response(INDEX_HTML_GZIP, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(INDEX_ETAG + '-gzip')
+    else:
+        response = Response(INDEX_HTML, mimetype='text/html')
+        response.set_etag(INDEX_ETAG)
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response.make_conditional(request)
 
 @app.route('/predict', methods=['POST'])
 def predict():
     try:
         if 'file' not in request.files:
-            return jsonify({'success': False, 'error': 'No file uploaded'})
+            return ojson({'success': False, 'error': 'No file uploaded'})
         
         file = request.files['file']
         if file.filename == '':
-            return jsonify({'success': False, 'error': 'No file selected'})
+            return ojson({'success': False, 'error': 'No file selected'})
         
         image_bytes = file.read()
         predictions = predict_image(image_bytes)
         
-        return jsonify({'success': True, 'predictions': predictions})
+        return ojson({'success': True, 'predictions': predictions})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
-
-if __name__ == '__main__':
-    port = int(os.getenv('PORT', 5000))
-    app.run(debug=False, host='0.0.0.0', port=port, threaded=True)
+        return ojson({'success': False, 'error': str(e)})
 
 HTML_TEMPLATE = '''
 <!DOCTYPE html>
@@ -520,4 +920,13 @@ HTML_TEMPLATE = '''
     </script>
 </body>
 </html>
-'''
\ No newline at end of file
+'''
+
+# The page has no dynamic content, so encode, hash and compress it once instead of rendering per hit
+INDEX_HTML = HTML_TEMPLATE.encode('utf-8')
+INDEX_HTML_GZIP = gzip.compress(INDEX_HTML)
+INDEX_ETAG = hashlib.md5(INDEX_HTML).hexdigest()
+
+if __name__ == '__main__':
+    port = int(os.getenv('PORT', 5000))
+    app.run(debug=False, host='0.0.0.0', port=port, threaded=True)
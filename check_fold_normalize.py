@@ -0,0 +1,71 @@
+"""Check that fold_normalize matches the unfolded pipeline numerically on a real image.
+
+Decodes and preprocesses the image exactly as the server does, then runs the FP32
+ResNet50 two ways - Normalize applied to the tensor with conv1's zero padding, and
+Normalize folded into conv1 fed through the mean-padded input buffer - and asserts
+the logits match, in FP32 and under BF16 autocast.
+
+    python check_fold_normalize.py photo.jpg
+"""
+import copy
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+
+def run_checks(image_path):
+    # Check the FP32 model on the default torch path with the fold switched on
+    os.environ['QUANTIZE'] = '0'
+    os.environ['MODEL_BACKEND'] = 'eager'
+    os.environ['FOLD_NORMALIZE'] = '1'
+    import torch
+    from torchvision import models
+    from torchvision.transforms import v2
+    import c
+
+    assert c.FOLD_NORMALIZE and c.INPUT_PAD == 3
+    reference = models.resnet50(weights=models.ResNet50_Weights.DEFAULT).eval()
+    folded = c.fold_normalize(copy.deepcopy(reference))
+
+    with open(image_path, 'rb') as f:
+        image_bytes = f.read()
+    # preprocess stops at [0, 1] pixels when folding; the reference normalizes them itself
+    pixels = c.preprocess(c.decode_image(image_bytes)).unsqueeze(0)
+    normalized = v2.Normalize(mean=c.NORMALIZE_MEAN, std=c.NORMALIZE_STD)(pixels)
+    padded = c.new_batch_buffer(1)
+    padded[:, :, c.INPUT_PAD:c.INPUT_PAD + 224, c.INPUT_PAD:c.INPUT_PAD + 224].copy_(pixels)
+
+    with torch.inference_mode():
+        expected = reference(normalized)
+        actual = folded(padded)
+        with torch.autocast('cpu', dtype=torch.bfloat16):
+            expected_bf16 = reference(normalized).float()
+            actual_bf16 = folded(padded).float()
+
+    fp32_error = (actual - expected).abs().max().item()
+    print(f"FP32 max abs logit error: {fp32_error:.2e}")
+    assert torch.allclose(actual, expected, rtol=1e-4, atol=1e-3), "folded FP32 logits diverge"
+
+    # BF16 rounds either way; the fold (raw pixels plus a large negative conv1 bias)
+    # must not add materially more error than BF16 on the unfolded model does
+    unfolded_error = (expected_bf16 - expected).abs().max().item()
+    folded_error = (actual_bf16 - expected).abs().max().item()
+    print(f"BF16 max abs logit error: unfolded {unfolded_error:.2e}, folded {folded_error:.2e}")
+    assert torch.allclose(actual_bf16, expected, rtol=0, atol=2 * unfolded_error + 1e-2), \
+        "folded BF16 logits drift further than unfolded BF16"
+
+    expected_top5 = expected.topk(5).indices.tolist()
+    assert actual.topk(5).indices.tolist() == expected_top5, "FP32 top-5 classes differ"
+    assert actual_bf16.argmax(dim=1).tolist() == expected_bf16.argmax(dim=1).tolist(), "BF16 top-1 classes differ"
+    print(f"top-5 classes: {expected_top5[0]}")
+    print("✅ fold_normalize matches the unfolded pipeline")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        sys.exit(__doc__)
+    # Import c in a spawned child: like the pool's own workers, it then skips
+    # starting the inference pool and only exposes the model helpers
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+        pool.submit(run_checks, sys.argv[1]).result()